@@ -5,12 +5,11 @@
 import io
 import struct
 import hashlib
-import binascii
 import calendar
 
-from copy import deepcopy
 from base58 import b58decode, b58encode
 from datetime import datetime
+from functools import lru_cache
 from collections import OrderedDict
 
 from ..errors import SerializationException
@@ -121,6 +120,10 @@ class DataStream():
     def getvalue(self):
         return bytearray(self.stream.getvalue())
 
+    def reset(self):
+        self.stream.seek(0)
+        self.stream.truncate()
+
     def pack_array(self, type, values):
         self.pack_varuint32(len(values))
         for v in values:
@@ -667,7 +670,7 @@ class DataStream():
 
     def unpack_rd160(self):
         d = self.read(20)
-        return binascii.hexlify(d).decode('utf-8')
+        return d.hex()
 
     def pack_sha256(self, v):
         if len(v) != 64: raise Exception("Invalid sha256 length")
@@ -675,7 +678,7 @@ class DataStream():
 
     def unpack_sha256(self):
         d = self.read(32)
-        return binascii.hexlify(d).decode('utf-8')
+        return d.hex()
 
     def pack_chain_id_type(self, v):
         self.pack_sha256(v)
@@ -883,9 +886,8 @@ class DataStream():
 
 import struct
 import hashlib
-import binascii
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from cryptos import hash_to_int, encode_privkey, decode, encode, \
     hmac, fast_multiply, G, inv, N, decode_privkey, get_privkey_format, random_key, encode_pubkey, privtopub
 
@@ -894,6 +896,9 @@ from base58 import b58decode, b58encode
 
 DATE_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
 
+# default tx expiration window
+TX_EXPIRATION_SECS = timedelta(minutes=15).total_seconds()
+
 
 def is_canonical(r: int, s: int) -> bool:
     r_bytes = r.to_bytes(32, byteorder='big')
@@ -922,10 +927,20 @@ def get_tapos_info(block_id) -> tuple[int, int]:
 
     return ref_block_num, ref_block_prefix
 
+# decoding the wif privkey is invariant across canonical nonce retries and
+# across transactions signed with the same key, do it once per key
+@lru_cache(maxsize=32)
+def decoded_privkey_parts(priv) -> tuple[bytes, int, bool]:
+    return (
+        encode_privkey(priv, 'bin'),
+        decode_privkey(priv),
+        'compressed' in get_privkey_format(priv)
+    )
+
 def deterministic_generate_k_nonce(msghash, priv, nonce):
     v = b'\x01' * 32
     k = b'\x00' * 32
-    priv = encode_privkey(priv, 'bin')
+    priv = decoded_privkey_parts(priv)[0]
     msghash = encode(hash_to_int(msghash) + nonce, 256, 32)
     k = hmac.new(k, v + b'\x00' + priv + msghash, hashlib.sha256).digest()
     v = hmac.new(k, v, hashlib.sha256).digest()
@@ -934,14 +949,16 @@ def deterministic_generate_k_nonce(msghash, priv, nonce):
     return decode(hmac.new(k, v, hashlib.sha256).digest(), 256)
 
 def ecdsa_raw_sign_nonce(msghash, priv, nonce):
+    _, priv_int, compressed = decoded_privkey_parts(priv)
+
     z = hash_to_int(msghash)
     k = deterministic_generate_k_nonce(msghash, priv, nonce)
 
     r, y = fast_multiply(G, k)
-    s = inv(k, N) * (z + r * decode_privkey(priv)) % N
+    s = inv(k, N) * (z + r * priv_int) % N
 
     v, r, s = 27 + ((y % 2) ^ (0 if s * 2 < N else 1)), r, s if s * 2 < N else N - s
-    if 'compressed' in get_privkey_format(priv):
+    if compressed:
         v += 4
     return v, r, s
 
@@ -969,7 +986,10 @@ def sign_bytes(ds, pk):
     m.update(ds.getvalue())
     return sign_hash(m.digest(), pk)
 
-def sign_tx(chain_id, tx, pk):
+def sign_tx_packed(chain_id, tx, pk):
+    # returns (signature, packed tx bytes) so callers that need the packed
+    # form (push bodies) reuse the bytes already produced for the digest
+    # instead of running pack_transaction a second time
     zeros = '0000000000000000000000000000000000000000000000000000000000000000'
 
     ds = DataStream()
@@ -982,14 +1002,17 @@ def sign_tx(chain_id, tx, pk):
     ds.write(packed_trx)
     ds.pack_checksum256(zeros)
 
-    sig = sign_bytes(ds, pk)
+    return sign_bytes(ds, pk), packed_trx
+
+def sign_tx(chain_id, tx, pk):
+    sig, packed_trx = sign_tx_packed(chain_id, tx, pk)
     if 'signatures' not in tx:
         tx['signatures'] = []
     tx['signatures'].append(sig)
 
     m = hashlib.sha256()
     m.update(packed_trx)
-    tx_id = binascii.hexlify(m.digest()).decode('utf-8')
+    tx_id = m.digest().hex()
 
     return tx_id, tx
 
@@ -1012,6 +1035,17 @@ def get_pub_key(pk):
     pubkey = "EOS" + b58encode(data).decode('utf8')
     return pubkey
 
+def pack_transfer(from_, to, quantity, memo='') -> str:
+    # hand-rolled packer for the ubiquitous token transfer shape
+    # (name from, name to, asset quantity, string memo), skips abi lookup
+    # and descriptor dispatch entirely
+    ds = DataStream()
+    ds.pack_name(from_)
+    ds.pack_name(to)
+    ds.pack_asset(quantity)
+    ds.pack_string(memo)
+    return ds.getvalue().hex()
+
 def build_action(action, auth, data):
     return {
         "account": action['account'],
@@ -1020,7 +1054,7 @@ def build_action(action, auth, data):
             "actor": auth['actor'],
             "permission": auth['permission']
         }],
-        "data": binascii.hexlify(data).decode('utf-8')
+        "data": data.hex()
     }
 
 def build_transaction(expiration, ref_block_num, ref_block_prefix, actions):
@@ -1060,13 +1094,20 @@ def create_tx(chain_id, block_id, expiration, privkey, fn_action_builder, params
     tx_id, signed_tx = sign_tx(chain_id, u_tx, privkey)
     return tx_id, signed_tx
 
-# given an abi and action data, return serialized data in hexstr format
-def pack_abi_data(abi: dict, action: dict) -> str:
-    ds = DataStream()
-    account = action['account']
-    name = action['name']
-    data = action['data']
+# per-field dispatch tags used in compiled action descriptors
+PACK_TAG_PLAIN = 0
+PACK_TAG_ARRAY = 1
+PACK_TAG_OPTIONAL = 2
+PACK_TAG_EXTENSION = 3
+PACK_TAG_ABI_BYTES = 4
+PACK_TAG_STR_COERCE = 5
+
 
+# scan an abi once for an action struct and precompute a per-field
+# (field_name, inner_type, dispatch_tag, pack_fn) descriptor, callers can
+# cache the result and hand it back to pack_abi_data to skip the scan and
+# the pack method lookup on repeat packs
+def compile_action_desc(abi: dict, account: str, name: str) -> list[tuple]:
     if 'structs' not in abi:
         raise SerializationException(f'expected abi to have \"structs\" key!')
 
@@ -1075,56 +1116,85 @@ def pack_abi_data(abi: dict, action: dict) -> str:
     if len(struct) != 1:
         raise SerializationException(f'expected only one struct def for {name}')
 
-    struct = struct[0]
-    struct_fields = {f['name']: f['type'] for f in struct['fields']}
-
-    if isinstance(data, list):
-        key_iter = iter(struct_fields.keys())
-        value_iter = iter(data)
-
-    else:
-        raise SerializationException(f'only list is supported as action params container')
-
-    for _ in range(len(data)):
-        field_name = next(key_iter)
-        value = next(value_iter)
-
-        typ = struct_fields.get(field_name, None)
-        if typ is None:
-            raise SerializationException(
-                f'expected field \"{field_name}\" to be in {list(struct_fields.keys())}')
-
-        fn_name = typ
-        pack_params = [value]
+    desc = []
+    for field in struct[0]['fields']:
+        field_name = field['name']
+        typ = field['type']
 
         if typ[-2:] == '[]':
-            fn_name = 'array'
-            pack_params = [typ[:-2], value]
+            entry = (field_name, typ[:-2], PACK_TAG_ARRAY, DataStream.pack_array)
 
         elif typ[-1] == '?':
-            fn_name = 'optional'
-            pack_params = [typ[:-1], value]
+            entry = (field_name, typ[:-1], PACK_TAG_OPTIONAL, DataStream.pack_optional)
 
         elif typ[-1] == '$':
-            pack_params = [typ[:-1], value]
+            entry = (
+                field_name, typ[:-1], PACK_TAG_EXTENSION,
+                getattr(DataStream, f'pack_{typ[:-1]}'))
 
         elif (account == 'eosio' and
-                name =='setabi' and
+                name == 'setabi' and
                 field_name == 'abi'):
+            entry = (field_name, typ, PACK_TAG_ABI_BYTES, DataStream.pack_bytes)
+
+        elif typ in ['name', 'asset', 'symbol']:
+            entry = (
+                field_name, typ, PACK_TAG_STR_COERCE,
+                getattr(DataStream, f'pack_{typ}'))
 
+        else:
+            entry = (
+                field_name, typ, PACK_TAG_PLAIN,
+                getattr(DataStream, f'pack_{typ}'))
+
+        desc.append(entry)
+
+    return desc
+
+
+# given an abi and action data, return serialized data in hexstr format
+def pack_abi_data(
+    abi: dict,
+    action: dict,
+    desc: list | None = None,
+    ds: DataStream | None = None
+) -> str:
+    if ds is None:
+        ds = DataStream()
+    else:
+        ds.reset()
+
+    account = action['account']
+    name = action['name']
+    data = action['data']
+
+    if desc is None:
+        desc = compile_action_desc(abi, account, name)
+
+    if not isinstance(data, list):
+        raise SerializationException(f'only list is supported as action params container')
+
+    if len(data) > len(desc):
+        raise SerializationException(
+            f'expected at most {len(desc)} fields for {name}'
+            f', got {len(data)} values')
+
+    for (field_name, typ, tag, pack_fn), value in zip(desc, data):
+        if tag == PACK_TAG_ARRAY or tag == PACK_TAG_OPTIONAL:
+            pack_fn(ds, typ, value)
+
+        elif tag == PACK_TAG_ABI_BYTES:
             abi_raw = DataStream()
             abi_raw.pack_abi(value)
-            pack_params = [abi_raw.getvalue()]
-            fn_name = 'bytes'
+            pack_fn(ds, abi_raw.getvalue())
 
-        elif typ in ['name', 'asset', 'symbol']:
-            pack_params = [str(value)]
+        elif tag == PACK_TAG_STR_COERCE:
+            pack_fn(ds, str(value))
 
-        pack_fn = getattr(ds, f'pack_{fn_name}')
-        pack_fn(*pack_params)
+        else:  # plain & extension pack the inner type directly
+            pack_fn(ds, value)
 
-    return binascii.hexlify(
-        ds.getvalue()).decode('utf-8')
+    return ds.getvalue().hex()
 
 
 def create_and_sign_tx(
@@ -1135,27 +1205,56 @@ def create_and_sign_tx(
     max_cpu_usage_ms=255,
     max_net_usage_words=0,
     ref_block_num: int = 0,
-    ref_block_prefix: int = 0
+    ref_block_prefix: int = 0,
+    action_cache: dict[tuple[str, str], list] | None = None
 ) -> dict:
 
+    # only the top level 'data' field gets overwritten with the packed hex,
+    # a shallow per-action copy is enough and avoids a recursive deepcopy
     tx = {
         'delay_sec': 0,
         'max_cpu_usage_ms': max_cpu_usage_ms,
-        'actions': deepcopy(actions)
+        'actions': [dict(a) for a in actions]
     }
 
-    # package transation
+    # package transation, one scratch stream reused for every action, abi and
+    # descriptor lookups amortized over runs of the same action (e.g. bulk
+    # 'activate' transactions repeat one action shape hundreds of times)
+    pack_ds = DataStream()
+    last_key = None
+    abi = None
+    desc = None
     for i, action in enumerate(tx['actions']):
+        if isinstance(action['data'], str):
+            # already packed hex, e.g. by a specialized packer like
+            # pack_transfer, nothing to do
+            continue
+
         account = action['account']
-        abi = abis.get(account, None)
-        if abi is None:
-            SerializationException(f'don\'t have abi for {account}')
+        name = action['name']
+        act_key = (account, name)
+
+        if act_key != last_key:
+            abi = abis.get(account, None)
+            if abi is None:
+                SerializationException(f'don\'t have abi for {account}')
+
+            if action_cache is not None:
+                desc = action_cache.get(act_key)
+                if desc is None:
+                    desc = compile_action_desc(abi, account, name)
+                    action_cache[act_key] = desc
+            else:
+                desc = compile_action_desc(abi, account, name)
 
-        tx['actions'][i]['data'] = pack_abi_data(abi, action)
+            last_key = act_key
+
+        tx['actions'][i]['data'] = pack_abi_data(
+            abi, action, desc=desc, ds=pack_ds)
 
     tx.update({
         'expiration': get_expiration(
-            datetime.utcnow(), timedelta(minutes=15).total_seconds()),
+            datetime.now(timezone.utc), TX_EXPIRATION_SECS),
         'ref_block_num': ref_block_num,
         'ref_block_prefix': ref_block_prefix,
         'max_net_usage_words': max_net_usage_words,
@@ -1166,11 +1265,7 @@ def create_and_sign_tx(
         'context_free_data': []
     })
 
-    # sign transaction
-    _, signed_tx = sign_tx(chain_id, tx, key)
-
-    # pack
-    ds = DataStream()
-    ds.pack_transaction(signed_tx)
-    packed_trx = binascii.hexlify(ds.getvalue()).decode('utf-8')
-    return build_push_transaction_body(signed_tx['signatures'][0], packed_trx)
+    # sign and pack in one pass, pack_transaction ignores signatures so the
+    # bytes hashed for the signature are exactly the packed_trx we push
+    sig, packed_trx = sign_tx_packed(chain_id, tx, key)
+    return build_push_transaction_body(sig, packed_trx.hex())
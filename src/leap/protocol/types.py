@@ -6,7 +6,6 @@ from dataclasses import dataclass
 
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from binascii import hexlify
 
 
 class ABCLeapType(ABC):
@@ -145,6 +144,14 @@ class Asset(ABCLeapType):
 
         return Asset(int(numeric), Symbol(sym, precision))
 
+    @staticmethod
+    def amount_from_str(str_asset: str) -> int:
+        '''Fast path for callers that only need the integer amount,
+        skips Symbol construction.
+        '''
+        numeric, _sym = str_asset.split(' ', 1)
+        return int(numeric.replace('.', ''))
+
     @staticmethod
     def from_decimal(dec: Decimal, precision: int, sym: str):
         result = str(dec)
@@ -162,8 +169,7 @@ class Asset(ABCLeapType):
 # name helpers
 
 def str_to_hex(c):
-    hex_data = hexlify(bytearray(c, 'ascii')).decode()
-    return int(hex_data, 16)
+    return int(c.encode('ascii').hex(), 16)
 
 
 def char_subtraction(a, b, add):
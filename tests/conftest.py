@@ -1,46 +1,85 @@
-#!/usr/bin/env python3
+import threading
 
 import pytest
 
-from leap.cleos import CLEOS
-from leap.fixtures import bootstrap_test_nodeos
+from pathlib import Path
 
 
-@pytest.fixture()
-def nodeless_cleos():
-    yield CLEOS()
+CONTRACTS_DIR = Path(__file__).parent / 'contracts'
+
+
+def pytest_configure(config):
+    # warm the nodeos image off the critical path: by the time the first
+    # dockerized fixture boots, the pull (or the local image lookup) is
+    # already done. best effort only -- a host without docker, or a run
+    # that never touches a dockerized fixture, must not notice
+    def _prefetch_nodeos_image():
+        try:
+            from leap.fixtures import default_nodeos_image, get_docker_client
+            client = get_docker_client()
+            try:
+                client.images.get(default_nodeos_image())
 
+            except Exception:
+                repo, tag = default_nodeos_image().split(':')
+                client.images.pull(repo, tag=tag)
 
-@pytest.fixture(scope='module')
-def cleos(request, tmp_path_factory):
-    with bootstrap_test_nodeos(request, tmp_path_factory) as cleos:
-        yield cleos
+        except Exception:
+            ...
 
+    threading.Thread(target=_prefetch_nodeos_image, daemon=True).start()
 
-@pytest.fixture(scope='module')
-def cleos_w_bootstrap(request, tmp_path_factory):
-    request.applymarker(pytest.mark.bootstrap(True))
-    with bootstrap_test_nodeos(request, tmp_path_factory) as cleos:
-        yield cleos
 
+def pytest_addoption(parser):
+    parser.addoption(
+        '--cleos-scope', action='store', default='module',
+        help='scope for the dockerized cleos fixtures: function, module '
+             'or session (session boots each fixture variant once for '
+             'the whole run)')
 
-@pytest.fixture(scope='module')
-def cleos_w_testcontract(request, tmp_path_factory):
-    deploy_marker = pytest.mark.contracts(
-        testcontract='tests/contracts/testcontract')
 
-    request.applymarker(deploy_marker)
+def _cleos_scope(fixture_name, config):
+    return config.getoption('--cleos-scope')
 
-    with bootstrap_test_nodeos(request, tmp_path_factory) as cleos:
-        yield cleos
 
+# contract paths pre-resolved once so deploys take the absolute-path
+# fast path and work regardless of the invocation cwd
+TESTCONTRACT_PATH = str((CONTRACTS_DIR / 'testcontract').resolve())
+EOSMECHS_PATH = str((CONTRACTS_DIR / 'eosmechanics').resolve())
 
-@pytest.fixture(scope='module')
-def cleos_w_eosmechs(request, tmp_path_factory):
-    deploy_marker = pytest.mark.contracts(
-        eosmechanics='tests/contracts/eosmechanics')
 
-    request.applymarker(deploy_marker)
+# leap imports are deferred into the fixture bodies: pulling in the http
+# and docker stacks at conftest import time taxes every collection, even
+# runs that never touch a dockerized fixture
+
+@pytest.fixture()
+def nodeless_cleos():
+    from leap.cleos import CLEOS
+    yield CLEOS()
+
 
-    with bootstrap_test_nodeos(request, tmp_path_factory) as cleos:
-        yield cleos
+def _make_cleos_fixture(name, bootstrap=None, contracts=None):
+    # all dockerized cleos fixtures are the same body modulo node config,
+    # generate them instead of copy-pasting. config goes straight into
+    # bootstrap_test_nodeos rather than through request.applymarker: at
+    # session scope every variant shares one Session node, and markers
+    # applied there by one variant would leak into the others
+    @pytest.fixture(scope=_cleos_scope, name=name)
+    def _fixture(request, tmp_path_factory):
+        from leap.fixtures import bootstrap_test_nodeos
+        with bootstrap_test_nodeos(
+            request, tmp_path_factory,
+            bootstrap=bootstrap, contracts=contracts
+        ) as cleos:
+            yield cleos
+
+    return _fixture
+
+
+# plain cleos passes no config so test-module markers still apply
+cleos = _make_cleos_fixture('cleos')
+cleos_w_bootstrap = _make_cleos_fixture('cleos_w_bootstrap', bootstrap=True)
+cleos_w_testcontract = _make_cleos_fixture(
+    'cleos_w_testcontract', contracts={'testcontract': TESTCONTRACT_PATH})
+cleos_w_eosmechs = _make_cleos_fixture(
+    'cleos_w_eosmechs', contracts={'eosmechanics': EOSMECHS_PATH})